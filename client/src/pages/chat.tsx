@@ -1,6 +1,10 @@
 import { useState, useEffect, useRef } from 'react';
 import { io, Socket } from 'socket.io-client';
 
+// Shared formatter for message timestamps; toLocaleTimeString() would build a new
+// Intl formatter for every message on every render
+const timeFormat = new Intl.DateTimeFormat(undefined, { hour: 'numeric', minute: '2-digit', second: '2-digit' });
+
 interface Message {
   role: 'user' | 'assistant'
   content: string
@@ -219,7 +223,7 @@ export default function Chat() {
                 )}
 
                 <div className={`text-xs mt-2 ${message.role === 'user' ? 'text-blue-100' : 'text-gray-500'}`}>
-                  {new Date(message.timestamp).toLocaleTimeString()}
+                  {timeFormat.format(message.timestamp)}
                 </div>
               </div>
             </div>
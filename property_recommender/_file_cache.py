@@ -0,0 +1,34 @@
+"""
+property_recommender/_file_cache.py
+
+Process-wide cache for small text files (JSON schemas, prompt attachments) that are
+read by every Matcher / ChatHandler instance.
+
+Entries are keyed on the file's path and modification time, so an edited file is
+re-read on next access while unchanged files are served from memory.
+
+Functions:
+  - read_text_cached(path) -> str
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Union
+
+
+@lru_cache(maxsize=32)
+def _read_text_cached(path_str: str, mtime: float) -> str:
+    """Read `path_str` as UTF-8; `mtime` is only part of the cache key."""
+    return Path(path_str).read_text(encoding="utf-8")
+
+
+def read_text_cached(path: Union[str, Path]) -> str:
+    """
+    Return the UTF-8 text of `path`, reusing the previous read while the file's
+    mtime is unchanged.
+
+    Raises:
+        OSError: If the file cannot be stat'ed or read.
+    """
+    path = Path(path)
+    return _read_text_cached(str(path), path.stat().st_mtime)
@@ -0,0 +1,72 @@
+"""
+property_recommender/_openai_client.py
+
+Shared OpenAI clients used by every LLM feature (user agent, chat handler, matcher).
+
+Each client keeps a pooled `httpx` transport with keep-alive, so successive and
+concurrent requests reuse open TCP/TLS connections instead of paying a fresh
+handshake per client. The API key is resolved (argument, else OPENAI_API_KEY) before
+the lookup, so `get_client()` and `get_client(key)` return the same client.
+
+The sync client is created once per key for the whole process. The async client's
+pooled connections belong to the event loop that opened them, so it is created once
+per key *per running event loop*: each `asyncio.run` gets its own client, and it is
+dropped together with its loop.
+
+Functions:
+  - get_client(api_key=None) -> OpenAI
+  - get_async_client(api_key=None) -> AsyncOpenAI  (call from inside a running loop)
+"""
+
+import os
+import asyncio
+import weakref
+from functools import lru_cache
+from typing import Dict, Optional
+
+import httpx
+from openai import AsyncOpenAI, OpenAI
+
+# Connection pool limits shared by the sync and async transports
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=50, max_connections=100)
+
+# Async clients per event loop, then per resolved API key
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Optional[str], AsyncOpenAI]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _resolve_key(api_key: Optional[str]) -> Optional[str]:
+    """Explicit key, else the OPENAI_API_KEY environment variable."""
+    return api_key or os.getenv("OPENAI_API_KEY")
+
+
+@lru_cache(maxsize=None)
+def _client_for_key(api_key: Optional[str]) -> OpenAI:
+    return OpenAI(api_key=api_key, http_client=httpx.Client(limits=HTTP_LIMITS))
+
+
+def get_client(api_key: Optional[str] = None) -> OpenAI:
+    """
+    Return the shared synchronous OpenAI client for `api_key`
+    (None falls back to the OPENAI_API_KEY environment variable).
+    """
+    return _client_for_key(_resolve_key(api_key))
+
+
+def get_async_client(api_key: Optional[str] = None) -> AsyncOpenAI:
+    """
+    Return the asynchronous OpenAI client for `api_key` bound to the running
+    event loop (None falls back to the OPENAI_API_KEY environment variable).
+
+    Raises:
+        RuntimeError: if called outside a running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    clients = _async_clients.setdefault(loop, {})
+    api_key = _resolve_key(api_key)
+    client = clients.get(api_key)
+    if client is None:
+        client = AsyncOpenAI(api_key=api_key, http_client=httpx.AsyncClient(limits=HTTP_LIMITS))
+        clients[api_key] = client
+    return client
@@ -8,6 +8,7 @@ and metadata-mapping hints for LLM confirmation.
 Key functions:
   - build_params_from_form(form: dict) -> (params: dict, match_hints: dict)
   - build_search_query(form: dict) -> (endpoint: str, params: dict, session: OAuth1Session, match_hints: dict)
+  - rebuild_with_overrides(prev_state, form: dict, suggestions: dict) -> same tuple as build_search_query
 
 Raises:
   - ValueError on unmappable form values.
@@ -62,16 +63,17 @@ def fuzzy_match_item(name: str, items: list, name_key: str) -> Any:
     return None
 
 
-def build_params_from_form(form: dict) -> Tuple[dict, dict]:
+# Form fields that feed the region/district/suburb resolution
+LOCATION_KEYS = ("region", "district", "suburb")
+
+
+def _resolve_location(form: dict) -> Tuple[dict, dict]:
     """
-    Convert the LLM form into Trade Me API query parameters and produce match hints.
+    Resolve the form's region/district/suburb against Trade Me metadata.
 
     Returns:
-        params (dict): Query parameters for Trade Me.
+        params (dict): Location query parameters (region, district, suburb IDs).
         match_hints (dict): Mapping details for region, district, and suburb.
-
-    Raises:
-        ValueError: If a form value cannot be matched or mapped.
     """
     params: Dict[str, Any] = {}
     match_hints: Dict[str, Dict[str, Any]] = {
@@ -170,6 +172,15 @@ def build_params_from_form(form: dict) -> Tuple[dict, dict]:
     if region_obj:
         params["region"] = region_obj.get("LocalityId")
 
+    return params, match_hints
+
+
+def _build_filter_params(form: dict) -> dict:
+    """
+    Map the form's numeric, property-type and sales-method fields to query parameters.
+    """
+    params: Dict[str, Any] = {}
+
     # Numeric filters
     numeric_map = [
         ("min_price", "price_min"), ("max_price", "price_max"),
@@ -195,6 +206,22 @@ def build_params_from_form(form: dict) -> Tuple[dict, dict]:
         # For now, just pass the sales methods as comma-separated text
         params["sale_method"] = ",".join(vals)
 
+    return params
+
+
+def build_params_from_form(form: dict) -> Tuple[dict, dict]:
+    """
+    Convert the LLM form into Trade Me API query parameters and produce match hints.
+
+    Returns:
+        params (dict): Query parameters for Trade Me.
+        match_hints (dict): Mapping details for region, district, and suburb.
+
+    Raises:
+        ValueError: If a form value cannot be matched or mapped.
+    """
+    params, match_hints = _resolve_location(form)
+    params.update(_build_filter_params(form))
     return params, match_hints
 
 
@@ -212,3 +239,41 @@ def build_search_query(
     params, match_hints = build_params_from_form(form)
     logger.info(f"Built query parameters: {params}")
     return endpoint, params, session, match_hints
+
+
+def rebuild_with_overrides(
+    prev_state: Tuple[str, dict, Union[OAuth1Session, None], dict],
+    form: dict,
+    suggestions: dict,
+) -> Tuple[str, dict, Union[OAuth1Session, None], dict]:
+    """
+    Rebuild a previously built search query after `suggestions` were applied to `form`.
+
+    Only the parts of the query affected by the suggested keys are recomputed:
+    location IDs are re-resolved when a location field changed, and the simple
+    filter params are re-mapped when any other field changed. The endpoint and
+    session are reused as-is.
+
+    Args:
+        prev_state: The (endpoint, params, session, match_hints) from the previous build.
+        form:        The form with `suggestions` already applied.
+        suggestions: The changed form fields.
+
+    Returns:
+        endpoint (str), params (dict), session (OAuth1Session), match_hints (dict)
+    """
+    endpoint, prev_params, session, match_hints = prev_state
+    params = dict(prev_params)
+
+    if any(k in LOCATION_KEYS for k in suggestions):
+        for k in LOCATION_KEYS:
+            params.pop(k, None)
+        location_params, match_hints = _resolve_location(form)
+        params.update(location_params)
+
+    if any(k not in LOCATION_KEYS for k in suggestions):
+        params = {k: v for k, v in params.items() if k in LOCATION_KEYS}
+        params.update(_build_filter_params(form))
+
+    logger.info(f"Rebuilt query parameters: {params}")
+    return endpoint, params, session, match_hints
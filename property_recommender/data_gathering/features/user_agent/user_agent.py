@@ -17,17 +17,18 @@ from pathlib import Path
 from dotenv import load_dotenv
 load_dotenv()
 
-from openai import OpenAI
 from jsonschema import validate, ValidationError
 
+from property_recommender._openai_client import get_client
+
 from .prompts import (
     build_user_agent_messages,
     SEARCH_SCHEMA,
     VALIDATE_SEARCH_QUERY,
 )
 
-# module‐level OpenAI client
-client = OpenAI()
+# module‐level OpenAI client (shared, pooled)
+client = get_client()
 
 # Configure logging
 logger = logging.getLogger(__name__)
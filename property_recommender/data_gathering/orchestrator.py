@@ -9,18 +9,30 @@ Top-level orchestrator for the property-recommender pipeline:
   5. Executes the search with pagination, rate-limit back-off, and retries.
   6. Saves intermediate files and all fetched raw properties to raw_properties.json.
 
+`gather_data_async` runs the same steps as an async producer, queueing each fetched
+page for concurrent matching (used by the end-to-end pipeline).
+
 Usage:
   python -m property_recommender.data_gathering.orchestrator
 """
 
 import argparse
+import asyncio
 import json
 import logging
+import os
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from property_recommender.data_gathering.features.user_agent.user_agent import run_user_agent, user_agent
-from property_recommender.data_gathering.features.query_builder.query_builder import build_search_query
-from property_recommender.data_gathering.features.fetch_executor.fetch_executor import fetch_raw_properties
+from property_recommender.data_gathering.features.query_builder.query_builder import (
+    build_search_query,
+    rebuild_with_overrides,
+)
+from property_recommender.data_gathering.features.fetch_executor.fetch_executor import (
+    fetch_raw_properties,
+    iter_raw_property_pages,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -33,38 +45,43 @@ logger = logging.getLogger(__name__)
 MAX_VALIDATION_TRIES = 2
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Run the property-recommender orchestrator.")
-    parser.add_argument("--profile",     help="Path to user_profile.json")
-    parser.add_argument("--output",      help="Path to save raw_properties.json")
-    parser.add_argument("--model",       default="gpt-4o", help="OpenAI model to use")
-    parser.add_argument("--temperature", type=float, default=0.7, help="LLM temperature")
-    parser.add_argument("--match-mode", choices=["batch", "individual"], default="individual",
-        help="Matching mode: batch ranking vs per-record scoring.")
-    parser.add_argument("--max-pages", type=int, default=2,
-        help="Maximum number of search result pages to fetch.")
-    args = parser.parse_args()
+def _write_json_atomic(path: Path, obj) -> None:
+    """
+    Write obj as pretty-printed JSON via a temp file + os.replace, so readers
+    never observe a partially written file.
+    """
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(obj, indent=2))
+    os.replace(tmp, path)
 
-    logger.info("Starting property-recommender orchestration...")
-    project_root = Path(__file__).parent.parent.parent
-    profile_path = Path(args.profile) if args.profile else project_root / "user_profile.json"
 
+def prepare_search(profile_path: Path) -> Optional[Tuple[str, Dict[str, Any], Any]]:
+    """
+    Steps 1-2: turn the user profile into a validated Trade Me search query.
+
+    Args:
+        profile_path: Path to user_profile.json.
+
+    Returns:
+        (endpoint, params, session), or None if the query could not be built
+        (errors are logged).
+    """
     # Load user profile
     try:
         user_profile = json.loads(profile_path.read_text())
     except Exception as e:
         logger.error(f"Failed to load user profile: {e}")
-        return
+        return None
 
     # Step 1: User Agent → filled_form.json
     try:
         form = run_user_agent(profile_path)
         filled_path = Path(__file__).parent / "filled_form.json"
-        filled_path.write_text(json.dumps(form, indent=2))
+        _write_json_atomic(filled_path, form)
         logger.info(f"Saved filled form to {filled_path}")
     except Exception as e:
         logger.error(f"User Agent failed: {e}")
-        return
+        return None
 
     # Fallback: ensure at least a district if LLM omitted all location
     if not any(form.get(k) for k in ("region", "district", "suburb")):
@@ -74,17 +91,22 @@ def main():
             logger.info(f"No location from LLM; falling back to district={fb}")
         else:
             logger.error("No location provided; aborting.")
-            return
+            return None
 
     # Step 2: Build + validate search query with LLM corrections
     endpoint = params = session = None
+    state = None
+    suggestions = {}
     for attempt in range(1, MAX_VALIDATION_TRIES + 1):
         try:
-            endpoint, params, session, match_hints = build_search_query(form)
-            # save the candidate query each attempt
-            query_path = Path(__file__).parent / "search_query.json"
-            query_path.write_text(json.dumps({"endpoint": endpoint, "params": params}, indent=2))
-            logger.info(f"Attempt {attempt}: Built search query, saved to {query_path}")
+            if state is None:
+                state = build_search_query(form)
+            else:
+                state = rebuild_with_overrides(state, form, suggestions)
+            endpoint, params, session, match_hints = state
+            logger.info(f"Attempt {attempt}: Built search query")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Attempt {attempt} candidate query: {json.dumps({'endpoint': endpoint, 'params': params})}")
 
             verdict = user_agent.validate_search_query(
                 form=form,
@@ -111,6 +133,88 @@ def main():
             f"Query not approved after {MAX_VALIDATION_TRIES} attempts; proceeding with last built query."
         )
 
+    # Save the final query once, after validation settles
+    if endpoint is not None:
+        query_path = Path(__file__).parent / "search_query.json"
+        _write_json_atomic(query_path, {"endpoint": endpoint, "params": params})
+        logger.info(f"Saved search query to {query_path}")
+
+    if endpoint is None:
+        logger.error("No search query could be built; aborting.")
+        return None
+    return endpoint, params, session
+
+
+async def gather_data_async(
+    profile_path: Path,
+    output_path: Path,
+    queue: "asyncio.Queue[Optional[List[Dict[str, Any]]]]",
+    max_records: int = 10,
+) -> List[Dict[str, Any]]:
+    """
+    Async producer for the end-to-end pipeline: builds the search query, then
+    puts each page of fetched listings on `queue` as soon as it is complete so
+    matching can start before gathering finishes. A final None marks the end of
+    the stream (also on failure). The blocking HTTP work runs in worker threads.
+
+    Args:
+        profile_path: Path to user_profile.json.
+        output_path: Where to save raw_properties.json once all pages are in.
+        queue: Queue receiving lists of raw listings, then None.
+        max_records: Maximum number of property records to fetch.
+
+    Returns:
+        All fetched raw listings (empty if gathering failed).
+    """
+    raw_props: List[Dict[str, Any]] = []
+    try:
+        search = await asyncio.to_thread(prepare_search, profile_path)
+        if search is None:
+            return raw_props
+        endpoint, params, session = search
+
+        # Step 3: Fetch raw properties page by page, handing each page to the consumer
+        pages = iter_raw_property_pages(endpoint, params, session, max_records=max_records)
+        while True:
+            try:
+                page_listings = await asyncio.to_thread(next, pages, None)
+            except Exception as e:
+                logger.error(f"Fetching properties failed: {e}")
+                break
+            if page_listings is None:
+                break
+            raw_props.extend(page_listings)
+            await queue.put(page_listings)
+    finally:
+        await queue.put(None)
+
+    # Step 4: Save raw data
+    output_path.write_text(json.dumps(raw_props, indent=2))
+    logger.info(f"Saved {len(raw_props)} properties to {output_path}")
+    return raw_props
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the property-recommender orchestrator.")
+    parser.add_argument("--profile",     help="Path to user_profile.json")
+    parser.add_argument("--output",      help="Path to save raw_properties.json")
+    parser.add_argument("--model",       default="gpt-4o", help="OpenAI model to use")
+    parser.add_argument("--temperature", type=float, default=0.7, help="LLM temperature")
+    parser.add_argument("--match-mode", choices=["batch", "individual"], default="individual",
+        help="Matching mode: batch ranking vs per-record scoring.")
+    parser.add_argument("--max-pages", type=int, default=2,
+        help="Maximum number of search result pages to fetch.")
+    args = parser.parse_args()
+
+    logger.info("Starting property-recommender orchestration...")
+    project_root = Path(__file__).parent.parent.parent
+    profile_path = Path(args.profile) if args.profile else project_root / "user_profile.json"
+
+    search = prepare_search(profile_path)
+    if search is None:
+        return
+    endpoint, params, session = search
+
     # Step 3: Fetch raw properties (limit to 10 records for faster demo)
     try:
         raw_props = fetch_raw_properties(endpoint, params, session, max_records=10)
@@ -3,13 +3,18 @@ property_recommender/data_gathering/providers/trademe_api.py
 
 This module handles interaction with the Trade Me API, including:
   1. OAuth1 authentication setup (sandbox or production environments).
-  2. Fetching and caching of metadata (regions, suburbs, property types, sales methods).
+  2. Fetching and caching of metadata (regions, suburbs, property types, sales methods),
+     persisted as human-readable JSON plus a pickle mirror for fast loading.
   3. Providing convenience accessors for common metadata types.
 
 Environment Variables (in .env file):
   - TM_ENV:                "sandbox" (default) or "production" to select base URL.
   - TRADEME_CONSUMER_KEY:    Your Trade Me API consumer key.
   - TRADEME_CONSUMER_SECRET: Your Trade Me API consumer secret.
+  - TRADEME_OAUTH_TOKEN / TRADEME_OAUTH_TOKEN_SECRET: Access token pair; if unset, a
+    still-valid token cached by trademe_token_gen.py is used.
+
+get_oauth_session() raises EnvironmentError if any of the credentials are missing.
 
 Usage:
   from data_gathering.providers.trademe_api import (
@@ -24,11 +29,17 @@ Example:
 
 import os
 import json
+import pickle
+from functools import lru_cache
 from pathlib import Path
 
+from requests.adapters import HTTPAdapter
 from requests_oauthlib import OAuth1Session
+from urllib3.util import Retry
 from dotenv import load_dotenv
 
+from property_recommender.data_gathering.providers.trademe_token_gen import load_cached_token
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -49,13 +60,42 @@ CONSUMER_SECRET = os.getenv("TRADEME_CONSUMER_SECRET")
 OAUTH_TOKEN = os.getenv("TRADEME_OAUTH_TOKEN")
 OAUTH_TOKEN_SECRET = os.getenv("TRADEME_OAUTH_TOKEN_SECRET")
 
+# Fall back to the token cached by trademe_token_gen.py
+if not OAUTH_TOKEN or not OAUTH_TOKEN_SECRET:
+    _cached_token = load_cached_token()
+    if _cached_token:
+        OAUTH_TOKEN = _cached_token["token"]
+        OAUTH_TOKEN_SECRET = _cached_token["secret"]
+
+# Transport-level retry policy for all Trade Me GETs: exponential back-off on
+# rate limiting and transient server errors, honouring Retry-After.
+HTTP_RETRY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET"],
+    respect_retry_after_header=True,
+)
+
 # Metadata cache file path
 METADATA_CACHE_FILE = Path(__file__).parent / "trademe_metadata.json"
 
+# Binary mirror of the JSON cache; much cheaper to load than re-parsing the Suburbs tree
+METADATA_PICKLE_FILE = METADATA_CACHE_FILE.with_suffix(".pickle")
+
+# In-process view of the metadata cache: metadata_type -> (file mtime, parsed value).
+# Entries are only trusted while the cache file's mtime is unchanged.
+_IN_MEM_CACHE: dict[str, tuple[float, dict]] = {}
 
+
+@lru_cache(maxsize=None)
 def get_oauth_session() -> OAuth1Session:
     """
-    Create and return an OAuth1Session for authenticating Trade Me API calls.
+    Return the process-wide OAuth1Session for authenticating Trade Me API calls.
+
+    The result is memoized and shared by all callers, so the credentials are only
+    checked on the first successful call. Retries and back-off are handled by an
+    HTTPAdapter mounted on the session (see HTTP_RETRY).
 
     Raises:
         EnvironmentError: If API credentials are missing.
@@ -68,12 +108,15 @@ def get_oauth_session() -> OAuth1Session:
         raise EnvironmentError(
             "Missing Trade Me OAuth tokens. Run trademe_token_gen.py to generate them."
         )
-    return OAuth1Session(
+    session = OAuth1Session(
         client_key=CONSUMER_KEY,
         client_secret=CONSUMER_SECRET,
         resource_owner_key=OAUTH_TOKEN,
         resource_owner_secret=OAUTH_TOKEN_SECRET,
     )
+    adapter = HTTPAdapter(max_retries=HTTP_RETRY, pool_connections=10, pool_maxsize=20)
+    session.mount("https://", adapter)
+    return session
 
 
 def fetch_metadata_from_api(metadata_type: str) -> dict:
@@ -105,6 +148,34 @@ def fetch_metadata_from_api(metadata_type: str) -> dict:
     return response.json()
 
 
+def _load_metadata_cache() -> dict:
+    """
+    Load the on-disk metadata cache, preferring the pickle mirror when it is at
+    least as new as the JSON file. The mirror is (re)written after a JSON load.
+    """
+    json_mtime = METADATA_CACHE_FILE.stat().st_mtime
+    if METADATA_PICKLE_FILE.exists() and METADATA_PICKLE_FILE.stat().st_mtime >= json_mtime:
+        try:
+            return pickle.loads(METADATA_PICKLE_FILE.read_bytes())
+        except Exception:
+            pass
+
+    try:
+        cache = json.loads(METADATA_CACHE_FILE.read_text())
+    except json.JSONDecodeError:
+        return {}
+    _write_pickle_mirror(cache)
+    return cache
+
+
+def _write_pickle_mirror(cache: dict) -> None:
+    """Persist the metadata cache in pickle form; failures only cost speed."""
+    try:
+        METADATA_PICKLE_FILE.write_bytes(pickle.dumps(cache, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass
+
+
 def get_metadata(metadata_type: str, force_refresh: bool = False) -> dict:
     """
     Retrieve metadata with optional caching to avoid repeated API calls.
@@ -118,19 +189,28 @@ def get_metadata(metadata_type: str, force_refresh: bool = False) -> dict:
     """
     key = metadata_type.lower()
     cache: dict = {}
+    mtime = None
 
     # Load cache if present
     if METADATA_CACHE_FILE.exists() and not force_refresh:
-        try:
-            cache = json.loads(METADATA_CACHE_FILE.read_text())
-        except json.JSONDecodeError:
-            cache = {}
+        mtime = METADATA_CACHE_FILE.stat().st_mtime
+        entry = _IN_MEM_CACHE.get(key)
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+        cache = _load_metadata_cache()
 
     # Fetch fresh if needed
     if force_refresh or key not in cache:
         data = fetch_metadata_from_api(key)
         cache[key] = data
         METADATA_CACHE_FILE.write_text(json.dumps(cache, indent=2))
+        _write_pickle_mirror(cache)
+        mtime = METADATA_CACHE_FILE.stat().st_mtime
+
+    # Remember every parsed entry so later lookups skip the file entirely
+    _IN_MEM_CACHE.clear()
+    for name, value in cache.items():
+        _IN_MEM_CACHE[name] = (mtime, value)
 
     return cache[key]
 
@@ -11,16 +11,25 @@ This will:
   4. Prompt you for the PIN (verifier) returned on approval.
   5. Exchange the verifier for a long-lived access token & secret.
   6. Write TRADEME_OAUTH_TOKEN and TRADEME_OAUTH_TOKEN_SECRET into your .env.
+  7. Cache the token pair with an expiry in ~/.trademe_token.json (mode 0600).
+
+While the cached token is still valid, steps 2-5 are skipped and the cached pair is
+written back to .env instead; pass --force to run the full exchange anyway.
+`load_cached_token()` is also used by trademe_api when the .env has no token pair.
 
 Usage:
     cd property_recommender
-    python data_gathering/providers/trademe_token_gen.py
+    python data_gathering/providers/trademe_token_gen.py [--force]
 """
 
 import os
 import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from typing import Optional
 from urllib.parse import parse_qs
-from requests_oauthlib import OAuth1Session
 from dotenv import load_dotenv, find_dotenv, set_key
 
 # OAuth endpoints for the sandbox
@@ -28,7 +37,43 @@ REQUEST_TOKEN_URL    = "https://api.tmsandbox.co.nz/Oauth/RequestToken?scope=MyT
 AUTHORIZE_URL        = "https://www.tmsandbox.co.nz/Oauth/Authorize"
 ACCESS_TOKEN_URL     = "https://api.tmsandbox.co.nz/Oauth/AccessToken"
 
+# On-disk token cache; Trade Me OAuth1 access tokens are long-lived
+TOKEN_CACHE_FILE     = Path.home() / ".trademe_token.json"
+TOKEN_TTL_SECONDS    = 30 * 24 * 3600
+# Treat tokens this close to expiry as expired
+TOKEN_EXPIRY_MARGIN  = 300
+
+
+def save_cached_token(token: str, secret: str, ttl: int = TOKEN_TTL_SECONDS) -> None:
+    """Write the access token pair and its expiry to TOKEN_CACHE_FILE (mode 0600)."""
+    payload = {"token": token, "secret": secret, "expires_at": time.time() + ttl}
+    fd = os.open(TOKEN_CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump(payload, f)
+
+
+def load_cached_token() -> Optional[dict]:
+    """
+    Return the cached {token, secret, expires_at} if it is valid for at least
+    TOKEN_EXPIRY_MARGIN more seconds, else None.
+    """
+    try:
+        cached = json.loads(TOKEN_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return None
+    if not cached.get("token") or not cached.get("secret"):
+        return None
+    if cached.get("expires_at", 0) - time.time() <= TOKEN_EXPIRY_MARGIN:
+        return None
+    return cached
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Generate Trade Me OAuth access tokens.")
+    parser.add_argument("--force", action="store_true",
+        help="Ignore a still-valid cached token and run the full OAuth exchange.")
+    args = parser.parse_args()
+
     # 1. Load .env
     dotenv_path = find_dotenv(usecwd=True)
     if not dotenv_path:
@@ -43,6 +88,17 @@ def main():
         print("❌ TRADEME_CONSUMER_KEY and/or TRADEME_CONSUMER_SECRET not set in .env")
         sys.exit(1)
 
+    # Reuse a still-valid cached token instead of repeating the exchange
+    cached = None if args.force else load_cached_token()
+    if cached:
+        print("✅ Reusing cached Trade Me OAuth token. Writing to .env…")
+        set_key(dotenv_path, "TRADEME_OAUTH_TOKEN", cached["token"])
+        set_key(dotenv_path, "TRADEME_OAUTH_TOKEN_SECRET", cached["secret"])
+        return
+
+    # Imported here so the cached-token path never loads the OAuth stack
+    from requests_oauthlib import OAuth1Session
+
     # 3. Obtain a request token (PIN-based)
     print("🔑 Fetching request token from Trade Me sandbox...")
     oauth = OAuth1Session(
@@ -67,15 +123,9 @@ def main():
         print("❌ No PIN entered; exiting.")
         sys.exit(1)
 
-    # 5. Exchange for access token
-    oauth = OAuth1Session(
-        client_key=consumer_key,
-        client_secret=consumer_secret,
-        resource_owner_key=resource_owner_key,
-        resource_owner_secret=resource_owner_secret,
-        verifier=verifier
-    )
-    access_resp = oauth.fetch_access_token(ACCESS_TOKEN_URL)
+    # 5. Exchange for access token on the same session (reuses its connection
+    #    and the request token it already holds)
+    access_resp = oauth.fetch_access_token(ACCESS_TOKEN_URL, verifier=verifier)
     access_token        = access_resp.get("oauth_token")
     access_token_secret = access_resp.get("oauth_token_secret")
     if not access_token or not access_token_secret:
@@ -87,6 +137,8 @@ def main():
     set_key(dotenv_path, "TRADEME_OAUTH_TOKEN", access_token)
     set_key(dotenv_path, "TRADEME_OAUTH_TOKEN_SECRET", access_token_secret)
     print("✅ .env updated with TRADEME_OAUTH_TOKEN and TRADEME_OAUTH_TOKEN_SECRET")
+    save_cached_token(access_token, access_token_secret)
+    print(f"✅ Token cached in {TOKEN_CACHE_FILE}")
     print("You can now re-run your pipeline against the sandbox.")
 
 if __name__ == "__main__":
@@ -0,0 +1,147 @@
+"""
+property_recommender/match_reasoning/features/_llm_cache.py
+
+Content-addressed response cache for OpenAI chat-completion calls.
+
+Identical requests (same model, temperature, messages, functions, ...) are keyed by the
+SHA-256 of their canonicalized kwargs; a hit returns the stored ChatCompletion without
+touching the API. Two backends are available:
+
+  - SQLite (default, local dev): a single file, `.llm_cache.db` in the working directory.
+  - Redis (production): set REDIS_URL (default redis://localhost:6379/0); needs `redis`.
+
+Functions:
+  - make_cache(backend, ttl) -> Optional[LLMCache]
+  - acached_chat_completion(async_client, cache, **kwargs) -> ChatCompletion
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Optional
+
+from openai.types.chat import ChatCompletion
+
+# Default location of the SQLite cache file
+DEFAULT_SQLITE_PATH = Path(".llm_cache.db")
+
+# Default time-to-live for cached responses (seconds)
+DEFAULT_TTL = 86400
+
+CACHE_BACKENDS = ("none", "sqlite", "redis")
+
+
+class LLMCache(ABC):
+    """Minimal string key/value store with per-entry expiry."""
+
+    def __init__(self, ttl: Optional[int] = DEFAULT_TTL):
+        self.ttl = ttl
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Stored value for `key`, or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: str) -> None:
+        """Store `value` under `key` for `ttl` seconds (forever if ttl is falsy)."""
+
+
+class SQLiteCache(LLMCache):
+    """LLMCache stored in a local SQLite file."""
+
+    def __init__(self, path: Path = DEFAULT_SQLITE_PATH, ttl: Optional[int] = DEFAULT_TTL):
+        super().__init__(ttl)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at is not None and expires_at < time.time():
+            return None
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        expires_at = time.time() + self.ttl if self.ttl else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, expires_at),
+            )
+            self._conn.commit()
+
+
+class RedisCache(LLMCache):
+    """LLMCache stored in Redis; expiry is delegated to Redis."""
+
+    def __init__(self, url: Optional[str] = None, ttl: Optional[int] = DEFAULT_TTL):
+        super().__init__(ttl)
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError("The redis cache backend requires the 'redis' package.") from e
+        self._redis = redis.Redis.from_url(url or os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._redis.get(key)
+        return value.decode("utf-8") if value is not None else None
+
+    def set(self, key: str, value: str) -> None:
+        self._redis.set(key, value, ex=self.ttl or None)
+
+
+def make_cache(backend: str, ttl: Optional[int] = DEFAULT_TTL) -> Optional[LLMCache]:
+    """
+    Build the cache for a CLI `--cache-backend` value ('none', 'sqlite' or 'redis').
+    """
+    if backend == "none":
+        return None
+    if backend == "sqlite":
+        return SQLiteCache(ttl=ttl)
+    if backend == "redis":
+        return RedisCache(ttl=ttl)
+    raise ValueError(f"Unknown cache backend: {backend!r}")
+
+
+def cache_key(**kwargs: Any) -> str:
+    """SHA-256 over the canonical JSON form of the request kwargs."""
+    canonical = json.dumps(kwargs, sort_keys=True, separators=(",", ":"), default=str)
+    return "llm:" + hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _finished(resp: ChatCompletion) -> bool:
+    """True if the completion ended normally (not cut off at max_tokens, filtered, ...)."""
+    return bool(resp.choices) and resp.choices[0].finish_reason == "stop"
+
+
+async def acached_chat_completion(async_client, cache: Optional[LLMCache], **kwargs: Any) -> ChatCompletion:
+    """
+    Await `async_client.chat.completions.create(**kwargs)`, serving from / storing
+    to `cache`. With `cache=None` this is a plain pass-through. Only completions
+    that finished with "stop" are stored, so a truncated answer is never replayed.
+    """
+    if cache is None:
+        return await async_client.chat.completions.create(**kwargs)
+    key = cache_key(**kwargs)
+    hit = cache.get(key)
+    if hit is not None:
+        return ChatCompletion.model_validate_json(hit)
+    resp = await async_client.chat.completions.create(**kwargs)
+    if _finished(resp):
+        cache.set(key, resp.model_dump_json())
+    return resp
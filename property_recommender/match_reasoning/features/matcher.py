@@ -2,29 +2,144 @@
 """
 property_recommender/match_reasoning/features/matcher.py
 
-Matcher supports two modes of matching property listings to a user profile via LLM:
+Matcher supports four modes of matching property listings to a user profile via LLM:
 
 1. Batch ranking (`match_batch`): a single LLM call on the full list, returning a
    sorted array of match entries.
-2. Individual scoring (`match_individual`): one LLM call per property record, then sort
-   locally. Use this when you hit context‐length limits.
+2. Individual scoring (`match_individual`): one LLM call per property record, issued
+   concurrently (bounded by `max_concurrency`), then sort locally. Use this when you
+   hit context‐length limits.
+3. Chunked ranking (`match_chunked`): the list is split into context-sized sub-batches
+   that are ranked concurrently, then merged and sorted locally.
+4. Batch API scoring (`match_individual_batchapi`): the individual-mode requests are
+   submitted as one OpenAI Batch API job (half price, completes within 24h) and
+   polled until done. For offline runs where latency does not matter.
+
+Each mode has an awaitable `a`-prefixed variant (`amatch_batch`, ...).
+
+All modes first drop listings that violate a hard constraint of the profile (price,
+bedrooms) without an LLM call; these are appended with score 0.
 
 By default, `match` is an alias for the chosen method.
 """
 
 import os
+import re
 import json
+import time
+import asyncio
+import hashlib
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
-from openai import OpenAI
 from json import JSONDecodeError
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
+from jsonschema.validators import validator_for
+from openai import AsyncOpenAI
+
+from property_recommender._file_cache import read_text_cached
+from property_recommender._openai_client import get_async_client, get_client
 
 from .prompts import SYSTEM_PROMPT, FINAL_FUNCTION_NAME, FINAL_FUNCTION_DESCRIPTION
+from ._llm_cache import LLMCache, cache_key, acached_chat_completion
+
+# Output-token budget per property in batch mode; caps runaway generations
+BATCH_TOKENS_PER_PROPERTY = 120
+
+# Token limits used to size sub-batches in chunked mode (gpt-4o class models)
+MODEL_CONTEXT_TOKENS = 128_000
+MODEL_OUTPUT_TOKENS = 16_384
+
+# Max concurrent sub-batch calls in chunked mode
+CHUNK_CONCURRENCY = 8
+
+# Seconds between status polls of an OpenAI Batch API job
+BATCH_API_POLL_SECONDS = 30
+
+# Pre-filter: listings priced above this multiple of the budget max are rejected
+PREFILTER_BUDGET_FACTOR = 2
+
+_PRICE_RE = re.compile(r"\$\s*([\d,]+)")
+_INT_RE = re.compile(r"\d+")
+
+
+def _dumps(obj: Any) -> str:
+    """Compact JSON for LLM payloads: no padding whitespace, non-ASCII kept as-is."""
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _content_key(obj: Any) -> bytes:
+    """Stable content hash of a JSON-serializable object (key order insensitive)."""
+    canonical = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).digest()
+
+
+def _listing_key(prop: Dict[str, Any]) -> Hashable:
+    """
+    Dedup key of a listing: its ListingId, so the same listing fetched twice
+    (with different per-fetch fields such as AsAt or ViewCount) matches. Records
+    without an id fall back to a content hash.
+    """
+    listing_id = prop.get("ListingId", prop.get("id"))
+    if listing_id is not None:
+        return ("id", listing_id)
+    return _content_key(prop)
+
+
+def _strict_schema(schema: Any) -> Any:
+    """
+    Copy of a JSON Schema usable as a Structured Outputs `strict` schema: drops
+    `$schema` and the numeric `minimum`/`maximum` keywords, which strict mode
+    rejects. Those bounds are still checked locally by the jsonschema validators.
+    """
+    if isinstance(schema, list):
+        return [_strict_schema(s) for s in schema]
+    if not isinstance(schema, dict):
+        return schema
+    out = {}
+    for key, value in schema.items():
+        if key in ("$schema", "minimum", "maximum"):
+            continue
+        if key == "properties" and isinstance(value, dict):
+            # Keys here are property names, not keywords
+            out[key] = {name: _strict_schema(sub) for name, sub in value.items()}
+        else:
+            out[key] = _strict_schema(value)
+    return out
+
+
+def _response_format(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Structured Outputs `response_format` enforcing `schema` server-side."""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name":        FINAL_FUNCTION_NAME,
+            "description": FINAL_FUNCTION_DESCRIPTION,
+            "schema":      _strict_schema(schema),
+            "strict":      True
+        }
+    }
+
+
+def _attribute(prop: Dict[str, Any], name: str) -> Optional[str]:
+    """Value of a Trade Me listing attribute (e.g. 'bedrooms'), if present."""
+    for attr in prop.get("Attributes") or []:
+        if attr.get("Name") == name:
+            return attr.get("Value")
+    return None
+
+
+def _listing_price(prop: Dict[str, Any]) -> Optional[int]:
+    """First dollar amount in the listing's price text; None for auctions, tenders etc."""
+    text = prop.get("PriceDisplay") or _attribute(prop, "price") or ""
+    match = _PRICE_RE.search(text)
+    return int(match.group(1).replace(",", "")) if match else None
+
 
-# Shared OpenAI client
-_global_client: Optional[OpenAI] = None
+def _listing_bedrooms(prop: Dict[str, Any]) -> Optional[int]:
+    """Bedroom count parsed from the 'bedrooms' attribute (e.g. '3 bedrooms')."""
+    match = _INT_RE.search(_attribute(prop, "bedrooms") or "")
+    return int(match.group()) if match else None
 
 
 class Matcher:
@@ -33,17 +148,23 @@ class Matcher:
 
     Methods:
       - match_batch:      Batch ranking via single LLM call.
-      - match_individual: Per-record scoring + local sort.
+      - match_individual: Per-record scoring (concurrent) + local sort.
+      - match_chunked:    Concurrent batch ranking of sub-batches + local merge/sort.
+      - match_individual_batchapi: Per-record scoring via the OpenAI Batch API.
+      - amatch_*:         Awaitable variants of the above.
       - match: alias to the chosen method.
     """
 
     def __init__(
         self,
         schema_path: Path,
-        model: str = "gpt-4o",
+        model: str = "gpt-4o-mini",
         temperature: float = 0.7,
         retry_limit: int = 2,
         api_key: Optional[str] = None,
+        max_concurrency: int = 20,
+        cache: Optional[LLMCache] = None,
+        fallback_model: Optional[str] = "gpt-4o",
     ):
         """
         Initialize the Matcher.
@@ -54,6 +175,10 @@ class Matcher:
             temperature:  LLM sampling temperature.
             retry_limit:  Number of retries for LLM calls.
             api_key:      OpenAI API key or use OPENAI_API_KEY env var.
+            max_concurrency: Max in-flight LLM calls in individual mode.
+            cache:        Optional response cache for LLM calls (see _llm_cache).
+            fallback_model: Stronger model to escalate to after two consecutive schema
+                          validation failures (None disables escalation).
         """
         # Load environment from project root .env
         from dotenv import load_dotenv
@@ -72,89 +197,215 @@ class Matcher:
         self.model = model
         self.temperature = temperature
         self.retry_limit = retry_limit
+        self.max_concurrency = max_concurrency
+        self.cache = cache
+        self.fallback_model = fallback_model
 
-        # Initialize shared client
-        global _global_client
-        if _global_client is None:
-            _global_client = OpenAI(api_key=self.api_key)
-        self.client = _global_client
+        # Shared sync client with pooled keep-alive connections; the async client
+        # is looked up per event loop (see `async_client`)
+        self.client = get_client(self.api_key)
 
         # Load full match-array schema
-        schema_text = Path(schema_path).read_text(encoding="utf-8")
+        schema_text = read_text_cached(schema_path)
         self.schema: Dict[str, Any] = json.loads(schema_text)
+        self.item_schema: Dict[str, Any] = self.schema["properties"]["matches"]["items"]
 
-        # Function-calling definition uses the array schema
-        self.function_def = {
-            "name":        FINAL_FUNCTION_NAME,
-            "description": FINAL_FUNCTION_DESCRIPTION,
-            "parameters":  self.schema
-        }
+        # Build validators once; they are reused for every LLM response
+        self._array_validator = validator_for(self.schema)(self.schema)
+        self._item_validator = validator_for(self.item_schema)(self.item_schema)
+
+        # Structured Outputs formats: the array schema for batch ranking, the
+        # item schema for per-property scoring
+        self.response_format = _response_format(self.schema)
+        self.item_response_format = _response_format(self.item_schema)
 
         # Base system message
         self.base_messages = [
             {"role": "system", "content": SYSTEM_PROMPT}
         ]
 
-    def match_batch(
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Pooled AsyncOpenAI client bound to the running event loop."""
+        return get_async_client(self.api_key)
+
+    def _prepare_prefix(self, user_profile: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Build the static message prefix (system prompt + serialized profile) once
+        per match call. Keeping it byte-identical across requests lets the
+        provider's automatic prompt caching reuse it.
+        """
+        return self.base_messages + [{
+            "role": "system",
+            "name": "user_profile",
+            "content": _dumps(user_profile)
+        }]
+
+    def _escalate(self, model: str, failures: int) -> Optional[str]:
+        """
+        Model to switch to after `failures` consecutive schema-validation failures:
+        `fallback_model` from the second failure on, unless it is unset or already
+        in use. Returns None to keep the current model.
+        """
+        if failures >= 2 and self.fallback_model and model != self.fallback_model:
+            return self.fallback_model
+        return None
+
+    def _prefilter(
         self,
         user_profile: Dict[str, Any],
         properties: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Deterministically reject listings that break a hard constraint of the
+        profile's `structured_needs`, so they never reach the LLM:
+
+          - price above PREFILTER_BUDGET_FACTOR x budget.max
+          - fewer bedrooms than bedrooms.min
+
+        Listings missing the relevant field (e.g. auctions with no price) pass.
+        Location is not checked here: the Trade Me search is already restricted
+        to the region/district fuzzy-resolved from `locations`.
+
+        Returns:
+            (candidates, rejects), where rejects are ready-made match entries
+            with score 0.0.
+        """
+        needs = user_profile.get("structured_needs") or {}
+        budget_max = (needs.get("budget") or {}).get("max")
+        min_bedrooms = (needs.get("bedrooms") or {}).get("min")
+
+        candidates: List[Dict[str, Any]] = []
+        rejects: List[Dict[str, Any]] = []
+        for prop in properties:
+            reason = None
+            price = _listing_price(prop)
+            bedrooms = _listing_bedrooms(prop)
+            if budget_max and price is not None and price > PREFILTER_BUDGET_FACTOR * budget_max:
+                reason = f"price ${price:,} exceeds {PREFILTER_BUDGET_FACTOR}x budget"
+            elif min_bedrooms and bedrooms is not None and bedrooms < min_bedrooms:
+                reason = f"{bedrooms} bedrooms, at least {min_bedrooms} required"
+
+            if reason is None:
+                candidates.append(prop)
+            else:
+                rejects.append({
+                    "property_id": prop.get("ListingId", prop.get("id")),
+                    "score": 0.0,
+                    "rationale": f"Hard constraint violation: {reason}"
+                })
+        return candidates, rejects
+
+    async def _stream_content(self, **kwargs: Any) -> Optional[str]:
+        """
+        Stream a completion and return the accumulated message content.
+
+        The stream is aborted as soon as the content visibly cannot be a JSON
+        object (first non-blank character is not '{'), so a bad attempt costs only
+        its first few tokens. Returns None when aborted or when no content came
+        back (e.g. a refusal). Only completions that finished normally are cached;
+        output cut off at `max_tokens` is returned but never replayed.
+        """
+        key = cache_key(stream=True, **kwargs) if self.cache else None
+        if key:
+            hit = self.cache.get(key)
+            if hit is not None:
+                return hit
+
+        stream = await self.async_client.chat.completions.create(stream=True, **kwargs)  # type: ignore
+        buf = ""
+        finish_reason = None
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                finish_reason = chunk.choices[0].finish_reason or finish_reason
+                content = chunk.choices[0].delta.content
+                if content:
+                    buf += content
+                    head = buf.lstrip()
+                    if head and head[0] != "{":
+                        print(f"Aborting stream: malformed JSON prefix {head[:20]!r}")
+                        return None
+        finally:
+            await stream.close()
+
+        if not buf:
+            return None
+        if key and finish_reason == "stop":
+            self.cache.set(key, buf)
+        return buf
+
+    async def amatch_batch(
+        self,
+        user_profile: Dict[str, Any],
+        properties: List[Dict[str, Any]],
+        prefix: Optional[List[Dict[str, Any]]] = None
     ) -> List[Dict[str, Any]]:
         """
-        Batch ranking: single LLM call on the entire property list.
+        Batch ranking: single streamed LLM call on the entire property list.
+
+        Args:
+            prefix: Pre-built message prefix (see `_prepare_prefix`), if the caller
+                    already has one for this profile.
 
         Returns:
-            A list of match entries (e.g. property_id, score, rationale), already sorted.
+            A list of match entries (e.g. property_id, score, rationale), already sorted;
+            pre-filtered rejects (see `_prefilter`) come last.
         """
-        messages = self.base_messages.copy()
-        messages.append({
-            "role": "system",
-            "name": "user_profile",
-            "content": json.dumps(user_profile)
-        })
+        properties, rejects = self._prefilter(user_profile, properties)
+        if not properties:
+            return rejects
+
+        messages = list(prefix) if prefix is not None else self._prepare_prefix(user_profile)
         messages.append({
             "role": "system",
             "name": "property_list",
-            "content": json.dumps(properties)
+            "content": _dumps(properties)
         })
 
-        for attempt in range(1, self.retry_limit + 1):
-            resp = self.client.chat.completions.create(  # type: ignore
-                model=self.model,
-                messages=messages,               # type: ignore
-                functions=[self.function_def],   # type: ignore
-                function_call={"name": FINAL_FUNCTION_NAME},
+        model = self.model
+        max_attempts = self.retry_limit
+        failures = 0  # consecutive schema-validation failures
+        attempt = 0
+        while attempt < max_attempts:
+            attempt += 1
+            raw = await self._stream_content(
+                model=model,
+                messages=messages,
+                response_format=self.response_format,
                 temperature=self.temperature,
+                max_tokens=min(BATCH_TOKENS_PER_PROPERTY * max(len(properties), 1), MODEL_OUTPUT_TOKENS),
             )
-            msg = resp.choices[0].message  # type: ignore
 
-            if not getattr(msg, "function_call", None):
-                messages.append({
-                    "role": "user",
-                    "content": (
-                        "Please return ONLY a JSON object matching the schema "
-                        "with a 'matches' array of entries (property_id, score, rationale)."
-                    )
-                })
+            # Strict mode guarantees schema-shaped JSON; only a refusal (no content)
+            # or output cut off at max_tokens leaves nothing parseable
+            if raw is None:
+                failures = 0
                 continue
-
-            raw = msg.function_call.arguments
             try:
                 result = json.loads(raw)
             except JSONDecodeError as e:
-                print(f"Attempt {attempt}: JSON parse error: {e}")
+                print(f"Attempt {attempt}: truncated JSON output: {e}")
+                failures = 0
                 messages.append({
                     "role": "user",
-                    "content": "Invalid JSON. Please return a valid JSON object."
+                    "content": "Your output was cut off. Keep each rationale shorter."
                 })
                 continue
 
             # Validate output
             try:
-                validate(instance=result, schema=self.schema)
+                self._array_validator.validate(result)
             except ValidationError as ve:
                 print(f"Attempt {attempt}: schema validation error: {ve.message}")
-                if attempt < self.retry_limit:
+                failures += 1
+                escalated = self._escalate(model, failures)
+                if escalated:
+                    # The fallback model gets one attempt of its own
+                    model = escalated
+                    max_attempts += 1
+                if attempt < max_attempts:
                     messages.append({
                         "role": "user",
                         "content": (
@@ -164,97 +415,321 @@ class Matcher:
                     continue
                 else:
                     raise RuntimeError(
-                        f"Schema validation failed after {self.retry_limit} attempts: {ve.message}"
+                        f"Schema validation failed after {attempt} attempts: {ve.message}"
                     )
 
             # Return the list of matches
-            return result.get("matches", [])
+            return result.get("matches", []) + rejects
 
         raise RuntimeError("Exceeded retries generating batch matches.")
 
-    def match_individual(
+    def match_batch(
         self,
         user_profile: Dict[str, Any],
         properties: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """
-        Individual scoring: one LLM call per property, then local sort.
+        Synchronous wrapper around `amatch_batch`.
 
         Returns:
-            A sorted list of match entries (property_id, score, rationale).
+            A list of match entries (e.g. property_id, score, rationale), already sorted.
         """
-        matches: List[Dict[str, Any]] = []
+        return asyncio.run(self.amatch_batch(user_profile, properties))
 
-        # Extract item schema from the array schema
-        item_schema = self.schema["properties"]["matches"]["items"]
+    def _estimate_chunk_size(
+        self,
+        prefix: List[Dict[str, Any]],
+        properties: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Pick a sub-batch size that fits the model's context and output budgets,
+        using ~4 characters per token as the estimate.
+        """
+        prefix_tokens = len(_dumps(prefix)) // 4
+        avg_property_tokens = sum(len(_dumps(p)) for p in properties) // (4 * len(properties)) + 1
+        by_context = (MODEL_CONTEXT_TOKENS - prefix_tokens) // avg_property_tokens
+        by_output = MODEL_OUTPUT_TOKENS // BATCH_TOKENS_PER_PROPERTY
+        return max(5, min(by_context, by_output))
 
-        # Build single-item function definition
-        item_fn = {
-            "name":        FINAL_FUNCTION_NAME,
-            "description": FINAL_FUNCTION_DESCRIPTION,
-            "parameters":  item_schema
-        }
+    async def amatch_chunked(
+        self,
+        user_profile: Dict[str, Any],
+        properties: List[Dict[str, Any]],
+        chunk_size: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Chunked ranking: split `properties` into sub-batches, rank them with
+        concurrent batch calls (at most CHUNK_CONCURRENCY in flight), then merge
+        and sort locally.
 
-        for prop in properties:
-            messages = self.base_messages.copy()
-            messages.append({
-                "role": "system",
-                "name": "user_profile",
-                "content": json.dumps(user_profile)
-            })
-            messages.append({
-                "role": "system",
-                "name": "property_list",
-                "content": json.dumps([prop])
-            })
-
-            for attempt in range(1, self.retry_limit + 1):
-                resp = self.client.chat.completions.create(  # type: ignore
-                    model=self.model,
-                    messages=messages,           # type: ignore
-                    functions=[item_fn],         # type: ignore
-                    function_call={"name": FINAL_FUNCTION_NAME},
+        Args:
+            chunk_size: Properties per sub-batch; estimated from token budgets if None.
+
+        Returns:
+            A sorted list of match entries (property_id, score, rationale);
+            pre-filtered rejects (see `_prefilter`) come last.
+        """
+        properties, rejects = self._prefilter(user_profile, properties)
+        if not properties:
+            return rejects
+
+        prefix = self._prepare_prefix(user_profile)
+        if chunk_size is None:
+            chunk_size = self._estimate_chunk_size(prefix, properties)
+        chunks = [properties[i:i + chunk_size] for i in range(0, len(properties), chunk_size)]
+
+        sem = asyncio.Semaphore(CHUNK_CONCURRENCY)
+
+        async def _rank(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            async with sem:
+                return await self.amatch_batch(user_profile, chunk, prefix=prefix)
+
+        results = await asyncio.gather(*[_rank(chunk) for chunk in chunks])
+        matches = [entry for chunk_matches in results for entry in chunk_matches]
+
+        # Sort descending by score
+        matches.sort(key=lambda x: x.get("score", 0), reverse=True)
+        return matches + rejects
+
+    def match_chunked(
+        self,
+        user_profile: Dict[str, Any],
+        properties: List[Dict[str, Any]],
+        chunk_size: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Synchronous wrapper around `amatch_chunked`.
+
+        Returns:
+            A sorted list of match entries (property_id, score, rationale).
+        """
+        return asyncio.run(self.amatch_chunked(user_profile, properties, chunk_size))
+
+    async def _score_one(
+        self,
+        prefix: List[Dict[str, Any]],
+        prop: Dict[str, Any],
+        sem: asyncio.Semaphore,
+    ) -> Dict[str, Any]:
+        """
+        Score a single property with its own LLM conversation, holding `sem`
+        for the duration so at most `max_concurrency` calls are in flight.
+        Only the final message (the property itself) differs from `prefix`;
+        retry feedback goes to a separate `extras` list so the shared messages
+        are never copied or mutated.
+        """
+        messages = prefix + [{
+            "role": "system",
+            "name": "property",
+            "content": _dumps(prop)
+        }]
+        extras: List[Dict[str, Any]] = []
+
+        model = self.model
+        max_attempts = self.retry_limit
+        failures = 0  # consecutive schema-validation failures
+        attempt = 0
+        async with sem:
+            while attempt < max_attempts:
+                attempt += 1
+                resp = await acached_chat_completion(  # type: ignore
+                    self.async_client,
+                    self.cache,
+                    model=model,
+                    messages=messages + extras if extras else messages,  # type: ignore
+                    response_format=self.item_response_format,
                     temperature=self.temperature,
                 )
                 msg = resp.choices[0].message  # type: ignore
 
-                if not getattr(msg, "function_call", None):
-                    messages.append({
-                        "role": "user",
-                        "content": "Please return ONLY a JSON object (property_id, score, rationale)."
-                    })
-                    continue
-
-                raw = msg.function_call.arguments
+                # Parse and validate entry. Strict mode guarantees schema-shaped JSON,
+                # but a refusal (no content) or output cut off at the token limit
+                # still fails here; both count like a schema validation failure.
                 try:
-                    entry = json.loads(raw)
-                except JSONDecodeError as e:
-                    print(f"Attempt {attempt}: JSON parse error: {e}")
-                    messages.append({
+                    entry = json.loads(msg.content)
+                    self._item_validator.validate(entry)
+                except (TypeError, JSONDecodeError, ValidationError) as e:
+                    if isinstance(e, ValidationError):
+                        print(f"Attempt {attempt}: schema validation error: {e.message}")
+                    else:
+                        print(f"Attempt {attempt}: no parseable JSON: {e}")
+                    failures += 1
+                    escalated = self._escalate(model, failures)
+                    if escalated:
+                        # The fallback model gets one attempt of its own
+                        model = escalated
+                        max_attempts += 1
+                    extras.append({
                         "role": "user",
-                        "content": "Invalid JSON. Please return a single JSON object."
+                        "content": (
+                            "Validation error; please correct the JSON." if msg.content
+                            else "Please score this property."
+                        )
                     })
                     continue
 
-                # Validate entry
+                return entry
+
+        raise RuntimeError(f"Failed to score property with entry: {prop.get('id')}")
+
+    async def amatch_individual(
+        self,
+        user_profile: Dict[str, Any],
+        properties: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Individual scoring: one LLM call per distinct property, dispatched
+        concurrently (at most `max_concurrency` in flight), then local sort.
+        Records of the same listing (same ListingId) within this call are scored
+        once and share the result.
+
+        Returns:
+            A sorted list of match entries (property_id, score, rationale);
+            pre-filtered rejects (see `_prefilter`) come last.
+        """
+        properties, rejects = self._prefilter(user_profile, properties)
+        if not properties:
+            return rejects
+
+        # Score each distinct listing once; duplicates (e.g. repeated across
+        # result pages) reuse the entry of their first occurrence
+        keys = [_listing_key(prop) for prop in properties]
+        unique: Dict[Hashable, Dict[str, Any]] = {}
+        for key, prop in zip(keys, properties):
+            unique.setdefault(key, prop)
+
+        prefix = self._prepare_prefix(user_profile)
+        sem = asyncio.Semaphore(self.max_concurrency)
+        entries = await asyncio.gather(*[
+            self._score_one(prefix, prop, sem)
+            for prop in unique.values()
+        ])
+        entry_for_key = dict(zip(unique.keys(), entries))
+        matches: List[Dict[str, Any]] = [dict(entry_for_key[key]) for key in keys]
+
+        # Sort descending by score
+        matches.sort(key=lambda x: x.get("score", 0), reverse=True)
+        return matches + rejects
+
+    def match_individual(
+        self,
+        user_profile: Dict[str, Any],
+        properties: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Synchronous wrapper around `amatch_individual`.
+
+        Returns:
+            A sorted list of match entries (property_id, score, rationale).
+        """
+        return asyncio.run(self.amatch_individual(user_profile, properties))
+
+    def match_individual_batchapi(
+        self,
+        user_profile: Dict[str, Any],
+        properties: List[Dict[str, Any]],
+        poll_seconds: int = BATCH_API_POLL_SECONDS
+    ) -> List[Dict[str, Any]]:
+        """
+        Individual scoring through the OpenAI Batch API: writes one
+        /v1/chat/completions request per distinct property to a JSONL file,
+        uploads it, submits a batch job and polls it until it finishes.
+        Entries that come back missing or invalid are re-scored live.
+
+        Args:
+            poll_seconds: Delay between batch status checks.
+
+        Returns:
+            A sorted list of match entries (property_id, score, rationale);
+            pre-filtered rejects (see `_prefilter`) come last.
+        """
+        properties, rejects = self._prefilter(user_profile, properties)
+        if not properties:
+            return rejects
+
+        keys = [_listing_key(prop) for prop in properties]
+        unique: Dict[Hashable, Dict[str, Any]] = {}
+        for key, prop in zip(keys, properties):
+            unique.setdefault(key, prop)
+        custom_ids = {key: f"property-{i}" for i, key in enumerate(unique)}
+
+        # 1. One request line per distinct property, all sharing the same prefix
+        prefix = self._prepare_prefix(user_profile)
+        lines = []
+        for key, prop in unique.items():
+            lines.append(_dumps({
+                "custom_id": custom_ids[key],
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": prefix + [{
+                        "role": "system",
+                        "name": "property",
+                        "content": _dumps(prop)
+                    }],
+                    "response_format": self.item_response_format,
+                    "temperature": self.temperature,
+                }
+            }))
+
+        # 2. Upload and submit
+        batch_file = self.client.files.create(
+            file=("property_matches.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"📤 Submitted batch {batch.id} with {len(lines)} requests")
+
+        # 3. Poll until the job reaches a terminal state
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_seconds)
+            batch = self.client.batches.retrieve(batch.id)
+            counts = batch.request_counts
+            if counts:
+                print(f"⏳ Batch {batch.id}: {batch.status} ({counts.completed}/{counts.total})")
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} ended with status {batch.status!r}")
+
+        # 4. Parse results; anything missing or invalid is re-scored live
+        entry_for_id: Dict[str, Dict[str, Any]] = {}
+        if batch.output_file_id:
+            output = self.client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
                 try:
-                    validate(instance=entry, schema=item_schema)
-                except ValidationError as ve:
-                    print(f"Attempt {attempt}: schema validation error: {ve.message}")
-                    messages.append({
-                        "role": "user",
-                        "content": "Validation error; please correct the JSON."
-                    })
+                    message = record["response"]["body"]["choices"][0]["message"]
+                    entry = json.loads(message["content"])
+                    self._item_validator.validate(entry)
+                except (KeyError, IndexError, TypeError, JSONDecodeError, ValidationError) as e:
+                    print(f"Batch result {record.get('custom_id')} unusable: {e}")
                     continue
+                entry_for_id[record["custom_id"]] = entry
 
-                matches.append(entry)
-                break
-            else:
-                raise RuntimeError(f"Failed to score property with entry: {prop.get('id')}")
+        missing = [key for key in unique if custom_ids[key] not in entry_for_id]
+        if missing:
+            print(f"🔁 Re-scoring {len(missing)} properties without a valid batch result…")
+
+            async def _rescore() -> List[Dict[str, Any]]:
+                sem = asyncio.Semaphore(self.max_concurrency)
+                return await asyncio.gather(*[
+                    self._score_one(prefix, unique[key], sem) for key in missing
+                ])
+
+            for key, entry in zip(missing, asyncio.run(_rescore())):
+                entry_for_id[custom_ids[key]] = entry
+
+        matches = [dict(entry_for_id[custom_ids[key]]) for key in keys]
 
         # Sort descending by score
         matches.sort(key=lambda x: x.get("score", 0), reverse=True)
-        return matches
+        return matches + rejects
 
     # Alias: choose default behavior here
     match = match_individual  # or switch to match_batch
@@ -5,16 +5,88 @@ property_recommender/match_reasoning/orchestrator.py
 Pipeline runner for Match Reasoning:
   1. Read user profile JSON.
   2. Read cleaned property listings JSON.
-  3. Score and rank listings via LLM (Matcher).
+  3. Score and rank listings via LLM (Matcher): batch, individual, chunked, or batch_api mode.
   4. Persist sorted match results to disk.
+
+`amatch_properties` is the streaming variant used by the end-to-end pipeline: it scores
+pages of listings from an asyncio.Queue as the data-gathering producer delivers them.
 """
 
 import argparse
+import asyncio
 import json
 import sys
 from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 from property_recommender.match_reasoning.features.matcher import Matcher
+from property_recommender.match_reasoning.features._llm_cache import CACHE_BACKENDS, make_cache
+
+
+def _load_json(path: Path) -> Any:
+    """Read and parse a UTF-8 JSON file (run in a worker thread)."""
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+async def arun_matching(
+    profile_path: Path,
+    listings_path: Path,
+    output_path: Path,
+    schema_path: Path,
+    model: str,
+    temperature: float,
+    retries: int,
+    mode: str,
+    cache_backend: str = "sqlite",
+    chunk_size: Optional[int] = None,
+    fallback_model: Optional[str] = "gpt-4o"
+):
+    # 1-3. Load profile and listings in worker threads while the Matcher
+    # (schema, validators, clients, cache) is built, so disk I/O overlaps setup
+    user_profile, listings, matcher = await asyncio.gather(
+        asyncio.to_thread(_load_json, profile_path),
+        asyncio.to_thread(_load_json, listings_path),
+        asyncio.to_thread(
+            Matcher,
+            schema_path=schema_path,
+            model=model,
+            temperature=temperature,
+            retry_limit=retries,
+            cache=make_cache(cache_backend),
+            fallback_model=fallback_model
+        ),
+        return_exceptions=True
+    )
+    if isinstance(user_profile, Exception):
+        sys.exit(f"❌ Failed to load user profile '{profile_path}': {user_profile}")
+    if isinstance(listings, Exception):
+        sys.exit(f"❌ Failed to load property listings '{listings_path}': {listings}")
+    if isinstance(matcher, Exception):
+        raise matcher
+
+    print(f"✅ Loaded profile and {len(listings)} listings")
+
+    # 4. Run matching
+    if mode == "batch":
+        print("🔢 Running batch ranking…")
+        matches = await matcher.amatch_batch(user_profile, listings)
+    elif mode == "chunked":
+        print("🧩 Running chunked batch ranking…")
+        matches = await matcher.amatch_chunked(user_profile, listings, chunk_size)
+    elif mode == "batch_api":
+        print("📦 Running individual scoring via the OpenAI Batch API…")
+        matches = await asyncio.to_thread(matcher.match_individual_batchapi, user_profile, listings)
+    else:
+        print("🔍 Running individual scoring…")
+        matches = await matcher.amatch_individual(user_profile, listings)
+
+    # 5. Persist output
+    try:
+        output_path.write_bytes(json.dumps(matches, indent=2, ensure_ascii=False).encode("utf-8"))
+    except Exception as e:
+        sys.exit(f"❌ Failed to write matches to '{output_path}': {e}")
+
+    print(f"💾 Wrote {len(matches)} matches to {output_path}")
 
 
 def run_matching(
@@ -25,41 +97,94 @@ def run_matching(
     model: str,
     temperature: float,
     retries: int,
-    mode: str
+    mode: str,
+    cache_backend: str = "sqlite",
+    chunk_size: Optional[int] = None,
+    fallback_model: Optional[str] = "gpt-4o"
 ):
+    """Synchronous wrapper around `arun_matching`."""
+    asyncio.run(arun_matching(
+        profile_path=profile_path,
+        listings_path=listings_path,
+        output_path=output_path,
+        schema_path=schema_path,
+        model=model,
+        temperature=temperature,
+        retries=retries,
+        mode=mode,
+        cache_backend=cache_backend,
+        chunk_size=chunk_size,
+        fallback_model=fallback_model
+    ))
+
+
+async def amatch_properties(
+    profile_path: Path,
+    queue: "asyncio.Queue[Optional[List[Dict[str, Any]]]]",
+    output_path: Path,
+    schema_path: Path,
+    model: str,
+    temperature: float,
+    retries: int,
+    mode: str,
+    cache_backend: str = "sqlite",
+    chunk_size: Optional[int] = None,
+    fallback_model: Optional[str] = "gpt-4o"
+):
+    """
+    Consume pages of listings from `queue` until a None sentinel, scoring each
+    page concurrently with the ones still being fetched, then merge, sort and
+    persist all matches. Listings already seen on an earlier page are skipped.
+    """
     # 1. Load user profile
     try:
         user_profile = json.loads(profile_path.read_text(encoding="utf-8"))
     except Exception as e:
         sys.exit(f"❌ Failed to load user profile '{profile_path}': {e}")
 
-    # 2. Load cleaned listings
-    try:
-        listings = json.loads(listings_path.read_text(encoding="utf-8"))
-    except Exception as e:
-        sys.exit(f"❌ Failed to load property listings '{listings_path}': {e}")
-
-    print(f"✅ Loaded profile and {len(listings)} listings")
-
-    # 3. Initialize Matcher
+    # 2. Initialize Matcher
     matcher = Matcher(
         schema_path=schema_path,
         model=model,
         temperature=temperature,
-        retry_limit=retries
+        retry_limit=retries,
+        cache=make_cache(cache_backend),
+        fallback_model=fallback_model
     )
 
-    # 4. Run matching
-    if mode == "batch":
-        print("🔢 Running batch ranking…")
-        matches = matcher.match_batch(user_profile, listings)
-    else:
-        print("🔍 Running individual scoring…")
-        matches = matcher.match_individual(user_profile, listings)
+    # 3. Start scoring each page as soon as it arrives; a listing repeated on a
+    #    later page (same ListingId) is only scored the first time
+    tasks = []
+    seen_ids = set()
+    while True:
+        listings = await queue.get()
+        if listings is None:
+            break
+        fresh = []
+        for prop in listings:
+            listing_id = prop.get("ListingId")
+            if listing_id is None or listing_id not in seen_ids:
+                seen_ids.add(listing_id)
+                fresh.append(prop)
+        listings = fresh
+        if not listings:
+            continue
+        print(f"📥 Scoring {len(listings)} newly fetched listings ({mode})…")
+        if mode == "batch":
+            coro = matcher.amatch_batch(user_profile, listings)
+        elif mode == "chunked":
+            coro = matcher.amatch_chunked(user_profile, listings, chunk_size)
+        else:
+            coro = matcher.amatch_individual(user_profile, listings)
+        tasks.append(asyncio.create_task(coro))
 
-    # 5. Persist output
+    results = await asyncio.gather(*tasks)
+    matches = [entry for page_matches in results for entry in page_matches]
+    matches.sort(key=lambda x: x.get("score", 0), reverse=True)
+
+    # 4. Persist output
     try:
-        output_path.write_text(json.dumps(matches, indent=2), encoding="utf-8")
+        output_path.write_bytes(json.dumps(matches, indent=2, ensure_ascii=False).encode("utf-8"))
     except Exception as e:
         sys.exit(f"❌ Failed to write matches to '{output_path}': {e}")
 
@@ -86,9 +211,13 @@ def main():
         help="Path to the property_match.json schema file"
     )
     parser.add_argument(
-        "--model", type=str, default="gpt-4o",
+        "--model", type=str, default="gpt-4o-mini",
         help="OpenAI model name to use for scoring"
     )
+    parser.add_argument(
+        "--fallback-model", type=str, default="gpt-4o",
+        help="Model to escalate to after two consecutive schema validation failures"
+    )
     parser.add_argument(
         "--temperature", type=float, default=0.7,
         help="Sampling temperature for the LLM (0.0–1.0)"
@@ -98,8 +227,20 @@ def main():
         help="Number of retry attempts for LLM calls"
     )
     parser.add_argument(
-        "--mode", choices=["batch", "individual"], default="individual",
-        help="Mode of matching: 'batch' for one-shot ranking, 'individual' for per-record scoring"
+        "--mode", choices=["batch", "individual", "chunked", "batch_api"], default="chunked",
+        help=(
+            "Mode of matching: 'batch' for one-shot ranking, 'individual' for per-record scoring, "
+            "'chunked' for concurrent ranking of context-sized sub-batches, "
+            "'batch_api' for per-record scoring as an OpenAI Batch API job (cheaper, up to 24h)"
+        )
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=None,
+        help="Properties per sub-batch in chunked mode (default: estimated from token budget)"
+    )
+    parser.add_argument(
+        "--cache-backend", choices=CACHE_BACKENDS, default="sqlite",
+        help="Where to cache LLM responses: 'sqlite' (.llm_cache.db), 'redis' (REDIS_URL), or 'none'"
     )
 
     args = parser.parse_args()
@@ -112,7 +253,10 @@ def main():
         model=args.model,
         temperature=args.temperature,
         retries=args.retries,
-        mode=args.mode
+        mode=args.mode,
+        cache_backend=args.cache_backend,
+        chunk_size=args.chunk_size,
+        fallback_model=args.fallback_model
     )
 
 
@@ -6,9 +6,14 @@ End-to-end Property Recommendation Pipeline:
   1. Run the interactive profile collection (writes user_profile.json)
   2. Run data gathering (raw_properties.json → clean_properties.json)
   3. Run match reasoning (clean_properties.json → property_matches.json)
+
+Phases 2 and 3 share one asyncio event loop: each page of listings is handed to the
+matcher through a queue as soon as it is fetched, so Trade Me requests and OpenAI
+scoring overlap instead of running back to back.
 """
 
 import argparse
+import asyncio
 import sys
 from pathlib import Path
 import json
@@ -17,10 +22,41 @@ import json
 from .user_interaction.main import main as collect_profile
 
 # Step 2: Data gathering
-from .data_gathering.orchestrator import main as gather_data
+from .data_gathering.orchestrator import gather_data_async
 
 # Step 3: Match reasoning
-from .match_reasoning.orchestrator import run_matching as match_properties
+from .match_reasoning.orchestrator import amatch_properties
+from .match_reasoning.features._llm_cache import CACHE_BACKENDS
+
+
+async def gather_and_match(args: argparse.Namespace) -> None:
+    """
+    Phases 2 + 3: run the data-gathering producer and the matching consumer
+    concurrently, connected by a queue of fetched listing pages.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    await asyncio.gather(
+        gather_data_async(
+            profile_path=args.profile,
+            output_path=args.raw_out,
+            queue=queue,
+            max_records=args.max_records
+        ),
+        amatch_properties(
+            profile_path=args.profile,
+            queue=queue,
+            output_path=args.matches_out,
+            schema_path=Path(__file__).parent / "match_reasoning" / "schemas" / "property_match.json",
+            model=args.model,
+            temperature=args.temperature,
+            retries=args.retries,
+            mode=args.match_mode,
+            cache_backend=args.cache_backend,
+            chunk_size=args.chunk_size,
+            fallback_model=args.fallback_model
+        )
+    )
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -43,9 +79,13 @@ def main():
         help="Path to write final ranked matches."
     )
     parser.add_argument(
-        "--model", type=str, default="gpt-4o",
+        "--model", type=str, default="gpt-4o-mini",
         help="OpenAI model for LLM calls."
     )
+    parser.add_argument(
+        "--fallback-model", type=str, default="gpt-4o",
+        help="Model the matcher escalates to after two consecutive schema validation failures."
+    )
     parser.add_argument(
         "--temperature", type=float, default=0.7,
         help="Sampling temperature for LLM calls."
@@ -59,13 +99,21 @@ def main():
         help="Use Trade Me sandbox endpoints for data gathering."
     )
     parser.add_argument(
-        "--match-mode", choices=["batch", "individual"], default="individual",
-        help="Matching mode: batch ranking vs per-record scoring."
+        "--match-mode", choices=["batch", "individual", "chunked"], default="chunked",
+        help="Matching mode: batch ranking, per-record scoring, or concurrent sub-batch ranking."
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=None,
+        help="Properties per sub-batch in chunked mode (default: estimated from token budget)."
     )
     parser.add_argument(
         "--max-records", type=int, default=10,
         help="Maximum number of property records to fetch for faster processing."
     )
+    parser.add_argument(
+        "--cache-backend", choices=CACHE_BACKENDS, default="sqlite",
+        help="Where to cache matching LLM responses: 'sqlite', 'redis', or 'none'."
+    )
     args = parser.parse_args()
 
     # 1. Profile collection
@@ -78,29 +126,10 @@ def main():
     if not args.profile.exists():
         sys.exit(f"❌ Profile file not found: {args.profile}")
 
-    # 2. Data gathering
+    # 2 + 3. Data gathering, with matching running on pages as they arrive
     print("\n🌐  Phase 2: Gathering property data…")
-    sys.argv = [
-        sys.argv[0],
-        "--profile", str(args.profile),
-        "--output", str(args.raw_out),
-        "--model", args.model,
-        "--temperature", str(args.temperature)
-    ]
-    gather_data()
-
-    # 3. Match reasoning
-    print("\n🏷️  Phase 3: Scoring and ranking properties…")
-    match_properties(
-        profile_path=args.profile,
-        listings_path=args.raw_out,
-        output_path=args.matches_out,
-        schema_path=Path(__file__).parent / "match_reasoning" / "schemas" / "property_match.json",
-        model=args.model,
-        temperature=args.temperature,
-        retries=args.retries,
-        mode=args.match_mode
-    )
+    print("🏷️  Phase 3: Scoring and ranking properties as they arrive…")
+    asyncio.run(gather_and_match(args))
 
     print(f"\n🎉  Pipeline complete! Final matches written to {args.matches_out}")
 
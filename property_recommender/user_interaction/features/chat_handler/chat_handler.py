@@ -6,26 +6,27 @@ Handles:
   - Ingestion of a system prompt
   - Optional attachments (e.g., schema, docs) as system messages  
   - Dynamic Q&A driven by the LLM until it decides to return structured output  
+  - Optional follow-up function letting the LLM ask several questions per turn
   - JSON parsing and JSON Schema validation of the final output
 """
 import os
+import sys
 import json
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 
-from openai import OpenAI
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
+from jsonschema.validators import validator_for
 
 from dotenv import load_dotenv
-from pathlib import Path
+
+from property_recommender._file_cache import read_text_cached
+from property_recommender._openai_client import get_client
 
 # Load environment variables from .env file
 env_path = Path(__file__).parents[3] / '.env'
 load_dotenv(env_path)
 
-# Global OpenAI client, initialized in the constructor
-client: Optional[OpenAI] = None
-
 
 class ChatHandler:
     """
@@ -35,11 +36,14 @@ class ChatHandler:
 
     def __init__(
         self,
-        system_prompt: str,
+        system_prompt: Union[str, List[Dict[str, Any]]],
         function_def: Dict[str, Any],
         schema: Dict[str, Any],
         attachments: Optional[Dict[str, Path]] = None,
-        model: str = "gpt-4o",
+        attachments_text: Optional[Dict[str, str]] = None,
+        followup_def: Optional[Dict[str, Any]] = None,
+        validator: Optional[Any] = None,
+        model: str = "gpt-4o-mini",
         temperature: float = 0.7,
         api_key: Optional[str] = None,
     ):
@@ -47,7 +51,9 @@ class ChatHandler:
         Initialize the ChatHandler.
 
         Args:
-            system_prompt: Instruction describing the agent's role and goals.
+            system_prompt: Instruction describing the agent's role and goals, either
+                           a string or a list of content parts, forwarded verbatim
+                           as the first (cacheable) system message.
             function_def: OpenAI function specification dict with keys:
                 - name: function name
                 - description: what the function does
@@ -55,11 +61,17 @@ class ChatHandler:
             schema: JSON Schema dict to validate the function output against.
             attachments: Optional mapping of attachment names to Path objects.
                          Contents will be sent as additional system messages.
-            model: Name of the OpenAI model to use (e.g., "gpt-4o").
+            attachments_text: Optional mapping of attachment names to already-loaded
+                              contents; sent like `attachments` without any file I/O.
+            followup_def: Optional OpenAI function specification whose arguments are
+                          {"questions": [...]}. When the model calls it, the questions
+                          are shown numbered and answered in a single user reply.
+            validator: Optional pre-built jsonschema validator for `schema`; built
+                       here when omitted.
+            model: Name of the OpenAI model to use (e.g., "gpt-4o-mini").
             temperature: Sampling temperature for the conversation.
             api_key: OpenAI API key; defaults to OPENAI_API_KEY environment variable.
         """
-        global client
         # Determine API key
         if api_key:
             self.api_key = api_key
@@ -68,13 +80,16 @@ class ChatHandler:
         else:
             raise ValueError("OpenAI API key must be provided or set in environment.")
 
-        # Initialize OpenAI client
-        client = OpenAI(api_key=self.api_key)
+        # Shared OpenAI client; reuses pooled connections across handlers
+        self.client = get_client(self.api_key)
 
         self.model = model
         self.temperature = temperature
         self.function_def = function_def
+        self.followup_def = followup_def
         self.schema = schema
+        # Build the output validator once rather than per validation (or reuse the caller's)
+        self._validator = validator if validator is not None else validator_for(schema)(schema)
 
         # Initialize chat history with the system prompt
         self.messages: List[Dict[str, Any]] = [
@@ -82,17 +97,21 @@ class ChatHandler:
         ]
 
         # Include attachments as extra system messages
+        texts: Dict[str, str] = {}
         if attachments:
             for name, path in attachments.items():
                 try:
-                    content = Path(path).read_text(encoding="utf-8")
+                    texts[name] = read_text_cached(path)
                 except Exception as e:
                     raise FileNotFoundError(f"Failed to read attachment '{name}': {e}")
-                self.messages.append({
-                    "role": "system",
-                    "name": name,
-                    "content": f"Attachment '{name}':\n{content}"
-                })
+        if attachments_text:
+            texts.update(attachments_text)
+        for name, content in texts.items():
+            self.messages.append({
+                "role": "system",
+                "name": name,
+                "content": f"Attachment '{name}':\n{content}"
+            })
 
     def chat(self) -> Dict[str, Any]:
         """
@@ -102,21 +121,61 @@ class ChatHandler:
         Returns:
             Parsed and schema-validated JSON object from the function call.
         """
-        global client
+        # Flush every delta on a terminal; when piped (e.g. to the web server, which
+        # treats each stdout write as a message) flush once per assistant turn.
+        live = sys.stdout.isatty()
+        functions = [self.function_def]
+        if self.followup_def:
+            functions.append(self.followup_def)
         while True:
-            # Query the model with auto function-calling enabled
-            response = client.chat.completions.create(
+            # Query the model with auto function-calling enabled, streaming the reply
+            stream = self.client.chat.completions.create(
                 model=self.model,
                 messages=self.messages,
-                functions=[self.function_def],
+                functions=functions,
                 function_call="auto",
-                temperature=self.temperature
+                temperature=self.temperature,
+                stream=True
             )
-            message = response.choices[0].message  # type: ignore
 
-            # If model invokes the function, parse and validate output
-            if getattr(message, 'function_call', None):
-                raw_args = message.function_call.arguments  # JSON string
+            # Print content deltas as they arrive; once a function_call shows up,
+            # accumulate its name and arguments instead
+            name_parts: List[str] = []
+            arg_parts: List[str] = []
+            is_function_call = False
+            printed = False
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                if delta.function_call is not None:
+                    is_function_call = True
+                    if delta.function_call.name:
+                        name_parts.append(delta.function_call.name)
+                    if delta.function_call.arguments:
+                        arg_parts.append(delta.function_call.arguments)
+                    continue
+                if delta.content and not is_function_call:
+                    if not printed:
+                        sys.stdout.write("\nAssistant: ")
+                        printed = True
+                    sys.stdout.write(delta.content)
+                    if live:
+                        sys.stdout.flush()
+
+            if is_function_call:
+                if printed:
+                    sys.stdout.write("\n")
+                    sys.stdout.flush()
+                name = "".join(name_parts)
+                raw_args = "".join(arg_parts)  # JSON string
+
+                # Follow-up questions: ask them all, collect one reply
+                if self.followup_def and name == self.followup_def["name"]:
+                    self._ask_followup(name, raw_args)
+                    continue
+
+                # Otherwise the model invoked the final function: parse and validate
                 try:
                     result = json.loads(raw_args)
                 except json.JSONDecodeError as e:
@@ -124,19 +183,45 @@ class ChatHandler:
                         f"Failed to parse JSON from function_call: {e}\nRaw: {raw_args}"
                     )
                 try:
-                    validate(instance=result, schema=self.schema)
+                    self._validator.validate(result)
                 except ValidationError as e:
                     raise ValueError(f"Output validation error: {e.message}")
                 return result
 
-            # Otherwise, display assistant message and prompt user
-            content = message.content
-            print(f"\nAssistant: {content}\n")
+            # Otherwise, finish the assistant message and prompt user
+            if not printed:
+                sys.stdout.write("\nAssistant: ")
+            sys.stdout.write("\n\n")
             print("You: ", end="", flush=True)
             user_input = input()
             # Record user response and continue
             self.messages.append({"role": "user", "content": user_input})
 
+    def _ask_followup(self, name: str, raw_args: str) -> None:
+        """
+        Show the questions of a follow-up function call as a numbered list, read
+        a single reply covering all of them, and record the call and the reply
+        in the conversation history.
+        """
+        try:
+            questions = json.loads(raw_args).get("questions") or []
+        except (json.JSONDecodeError, AttributeError) as e:
+            raise ValueError(
+                f"Failed to parse JSON from function_call: {e}\nRaw: {raw_args}"
+            )
+
+        numbered = "\n".join(f"  {i}. {q}" for i, q in enumerate(questions, 1))
+        print(f"\nAssistant:\n{numbered}\n")
+        print("You (answer by number): ", end="", flush=True)
+        user_input = input()
+
+        self.messages.append({
+            "role": "assistant",
+            "content": None,
+            "function_call": {"name": name, "arguments": raw_args}
+        })
+        self.messages.append({"role": "function", "name": name, "content": user_input})
+
     def reset(self) -> None:
         """
         Reset conversation history, preserving only the initial system messages.
@@ -170,10 +255,10 @@ if __name__ == "__main__":
 
     # Read system prompt from file
     system_prompt_path = Path(__file__).parents[2] / "prompts.py"
-    # Assuming prompts.py defines SYSTEM_PROMPT constant
-    from property_recommender.user_interaction.features.prompts import SYSTEM_PROMPT
+    # Assuming prompts.py defines SYSTEM_PROMPT_STATIC constant
+    from property_recommender.user_interaction.features.prompts import SYSTEM_PROMPT_STATIC
     handler = ChatHandler(
-        system_prompt=SYSTEM_PROMPT,
+        system_prompt=SYSTEM_PROMPT_STATIC,
         function_def=function_def,
         schema=schema,
         attachments={"property_profile": schema_path}
@@ -8,8 +8,12 @@ This file can be edited to adjust tone, follow-up logic, and completion conditio
 without touching core handler logic.
 """
 
-# The system prompt sets the agent’s persona, goals, and conversation style.
-SYSTEM_PROMPT = (
+import hashlib
+
+# Static part of the system prompt: persona, goals, and conversation style.
+# It must stay the first, byte-identical block so the provider's prefix cache can
+# reuse it; nothing derived from the schema belongs here.
+SYSTEM_PROMPT_STATIC = (
     "You are a professional real-estate interviewer, blending tactical empathy "
     "(drawing on Chris Voss techniques) with warmth, clarity, and a touch of confidence. "
     "At the very start, introduce yourself politely: “Hi! I’m Pete!"
@@ -21,20 +25,41 @@ SYSTEM_PROMPT = (
     "mirroring, ask thoughtful follow-ups, and avoid rigid or pushy Q&A"
     "helpful recommendations—e.g. “Based on two kids and home-office needs, how about at least three bedrooms?”—"
     "and then verify: “Does that sound right?” \n\n"
+    "Ask up to 3 independent questions per turn when they don't depend on each other, "
+    "by calling the function `ask_followup` with the list of questions; "
+    "the user answers them all in one reply. \n\n"
     "If the user expresses uncertainty, acknowledge it and move on, capturing that nuance in your summary. "
     "When When you’re confident you’ve gathered sufficient detail OR ,the user indicates they’ve shared everything—phrases like “that captures it” or “we’re ready”—"
     "wrap up the interview and call the function `collect_property_profile` with a JSON object exactly "
     "matching the provided schema. \n\n"
+)
+
+# The hash identifies the exact cached prefix, so logging it makes accidental
+# edits (which silently invalidate the provider's prompt cache) visible.
+SYSTEM_PROMPT_HASH = hashlib.sha256(SYSTEM_PROMPT_STATIC.encode("utf-8")).hexdigest()
+
+# Schema-dependent tail; `keys` is rendered from the loaded profile schema (see main.py).
+SYSTEM_PROMPT_SCHEMA_TAIL = (
     "That object must include:\n"
-    "  • narrative_summary: a free-form paragraph telling the user’s story and priorities.\n"
-    "  • structured_needs: only the fields you’re confident about "
-    "(bedrooms, bathrooms, budget, locations, timeline).\n"
-    "  • key_insights: a list of concise bullet strings "
-    "(e.g. “works from home”, “two young children”).\n"
+    "{keys}\n"
     "Use numbers for numeric values, include only schema-defined keys, and produce no extra text "
     "outside the function call."
 )
 
+
+def _system_cache_block(schema_tail: str) -> list:
+    """
+    System prompt as a structured system-message content list, shared by every
+    call site: the static persona block first, then the rendered schema tail.
+    OpenAI caches prompt prefixes automatically (there is no cache_control
+    marker), so a schema change only invalidates the tail.
+    """
+    return [
+        {"type": "text", "text": SYSTEM_PROMPT_STATIC},
+        {"type": "text", "text": schema_tail},
+    ]
+
+
 # Name of the function for OpenAI function-calling
 FINAL_FUNCTION_NAME = "collect_property_profile"
 
@@ -44,3 +69,12 @@ FINAL_FUNCTION_DESCRIPTION = (
     "containing exactly the keys narrative_summary, structured_needs, and key_insights. "
     "Output must conform precisely to the provided JSON schema."
 )
+
+# Name of the function the model calls to ask several questions in one turn
+FOLLOWUP_FUNCTION_NAME = "ask_followup"
+
+# Description of the follow-up function’s purpose
+FOLLOWUP_FUNCTION_DESCRIPTION = (
+    "Ask the user up to 3 independent questions at once; "
+    "they are shown numbered and answered in a single reply."
+)
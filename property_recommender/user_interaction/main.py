@@ -6,44 +6,90 @@ CLI entrypoint for the user_interaction module.
 
 This script orchestrates the dynamic interview workflow by:
   1. Loading the JSON Schema defining the property preference profile.
-  2. Building the OpenAI function definition for schema enforcement.
+  2. Building the OpenAI function definitions (final profile + multi-question follow-up).
   3. Attaching additional context documents.
   4. Instantiating the generic ChatHandler.
   5. Running the LLM-driven chat to collect a structured profile.
   6. Writing the resulting JSON profile to disk.
+
+Usage:
+  python -m property_recommender.user_interaction.main
 """
 import json
-import sys
-from os.path import dirname
+import logging
 from pathlib import Path
 
-# Ensure root package path for imports
-sys.path.append(dirname(dirname(__file__)))
-
 from property_recommender.user_interaction.features.prompts import (
-    SYSTEM_PROMPT,
+    SYSTEM_PROMPT_HASH,
+    SYSTEM_PROMPT_SCHEMA_TAIL,
+    _system_cache_block,
     FINAL_FUNCTION_NAME,
     FINAL_FUNCTION_DESCRIPTION,
+    FOLLOWUP_FUNCTION_NAME,
+    FOLLOWUP_FUNCTION_DESCRIPTION,
 )
 from property_recommender.user_interaction.features.chat_handler.chat_handler import ChatHandler
 
+from jsonschema import Draft7Validator
+from referencing import Registry, Resource
+
+
+logger = logging.getLogger(__name__)
+
+# Compiled profile validators keyed by the raw schema bytes
+_VALIDATORS: dict = {}
+
+
+def _compile_validator(schema_bytes: bytes, schema: dict, schema_uri: str) -> Draft7Validator:
+    """
+    Build (once per distinct schema) the validator for the profile output, with
+    the schema pre-registered under `schema_uri` so any $ref is resolved from
+    the registry instead of being looked up on each validation.
+    """
+    validator = _VALIDATORS.get(schema_bytes)
+    if validator is None:
+        registry = Registry().with_resource(uri=schema_uri, resource=Resource.from_contents(schema))
+        validator = _VALIDATORS[schema_bytes] = Draft7Validator(schema, registry=registry)
+    return validator
+
+
+def _render_schema_keys(schema: dict) -> str:
+    """
+    Describe the schema's top-level keys as prompt bullets, listing the fields
+    of nested objects (e.g. structured_needs).
+    """
+    lines = []
+    for key, spec in schema.get("properties", {}).items():
+        line = f"  • {key}: {spec.get('description', '')}"
+        fields = spec.get("properties")
+        if fields:
+            line += f" Only the fields you’re confident about ({', '.join(fields)})."
+        lines.append(line)
+    return "\n".join(lines)
+
 
 def main():
     """
     Main entrypoint for collecting and persisting the user property preference profile.
 
     Steps:
-      1. Load JSON Schema from `schemas/property_profile.json`.
-      2. Construct the OpenAI function definition.
+      1. Load JSON Schema from `schemas/property_profile.json` and compile its validator.
+      2. Construct the OpenAI function definitions.
       3. Define attachments for additional context (schema file).
       4. Instantiate ChatHandler with prompts, schema, and attachments.
       5. Run the chat loop to obtain the structured profile.
       6. Write `property_profile.json` to current directory.
     """
+    # Identify the cached prompt prefix; a change here means a cold prompt cache
+    logger.debug(f"System prompt sha256={SYSTEM_PROMPT_HASH}")
+
     # 1. Load the JSON Schema
     schema_path = Path(__file__).parent / "schemas" / "property_profile.json"
     try:
-        schema = json.loads(schema_path.read_text(encoding="utf-8"))
+        # Read the bytes once: they are parsed here, key the validator cache,
+        # and their decoded text becomes the schema attachment
+        schema_bytes = schema_path.read_bytes()
+        schema = json.loads(schema_bytes)
     except FileNotFoundError:
         print(f"Error: Schema file not found at {schema_path}")
         return
@@ -51,22 +97,47 @@ def main():
         print(f"Error: Failed to parse JSON Schema: {e}")
         return
 
-    # 2. Build the function definition for OpenAI function-calling
+    # Compile the output validator once; ChatHandler reuses it for every check
+    validator = _compile_validator(schema_bytes, schema, schema_path.resolve().as_uri())
+
+    # 2. Build the function definitions for OpenAI function-calling
     function_def = {
         "name": FINAL_FUNCTION_NAME,
         "description": FINAL_FUNCTION_DESCRIPTION,
         "parameters": schema,
     }
+    followup_def = {
+        "name": FOLLOWUP_FUNCTION_NAME,
+        "description": FOLLOWUP_FUNCTION_DESCRIPTION,
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "questions": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "maxItems": 3,
+                }
+            },
+            "required": ["questions"],
+        },
+    }
+
+    # Static persona first, schema-derived tail last (prefix-cache friendly)
+    system_prompt = _system_cache_block(
+        SYSTEM_PROMPT_SCHEMA_TAIL.format(keys=_render_schema_keys(schema))
+    )
 
-    # 3. Attach additional context documents
-    attachments = {"property_profile_schema": schema_path}
+    # 3. Attach additional context documents (reusing the schema text already read)
+    attachments_text = {"property_profile_schema": schema_bytes.decode("utf-8")}
 
     # 4. Instantiate the ChatHandler
     handler = ChatHandler(
-        system_prompt=SYSTEM_PROMPT,
+        system_prompt=system_prompt,
         function_def=function_def,
         schema=schema,
-        attachments=attachments,
+        validator=validator,
+        followup_def=followup_def,
+        attachments_text=attachments_text,
     )
 
     # 5. Run the chat loop to collect the user profile
@@ -79,7 +150,7 @@ def main():
     # 6. Persist the profile to disk
     output_path = Path.cwd() / "user_profile.json"
     try:
-        output_path.write_text(json.dumps(profile, indent=2), encoding="utf-8")
+        output_path.write_bytes(json.dumps(profile, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
         print(f"✅ Profile successfully saved to {output_path}")
     except Exception as e:
         print(f"Error writing profile to disk: {e}")
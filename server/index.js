@@ -22,6 +22,10 @@ app.use(express.static(path.join(__dirname, '../client')));
 // Store active Python processes by session
 const activeSessions = new Map();
 
+// The running pipeline process, if any. Runs share user_profile.json,
+// raw_properties.json and property_matches.json, so only one may run at a time.
+let pipelineProcess = null;
+
 // Serve the HTML file for all routes
 app.get('/', (req, res) => {
   res.sendFile(path.join(__dirname, '../client/index.html'));
@@ -33,12 +37,22 @@ io.on('connection', (socket) => {
 
   socket.on('start_session', (sessionId) => {
     console.log('Starting session:', sessionId);
+
+    if (pipelineProcess) {
+      console.log('Pipeline already running; rejecting session:', sessionId);
+      socket.emit('pipeline_error', {
+        message: 'Another recommendation is already in progress. Please try again once it has finished.',
+        timestamp: Date.now()
+      });
+      return;
+    }
     
     // Start the Python property recommendation pipeline
     const pythonProcess = spawn('python', ['-m', 'property_recommender.orchestrator'], {
       cwd: process.cwd(),
       stdio: ['pipe', 'pipe', 'pipe']
     });
+    pipelineProcess = pythonProcess;
 
     activeSessions.set(sessionId, {
       process: pythonProcess,
@@ -72,6 +86,7 @@ io.on('connection', (socket) => {
     // Handle process completion
     pythonProcess.on('close', (code) => {
       console.log(`Python process exited with code ${code}`);
+      pipelineProcess = null;
       
       if (code === 0) {
         // Try to read the results file
@@ -0,0 +1,117 @@
+"""
+tests/test_matcher.py
+
+Drives schema-validation failures through the Matcher retry loops with a fake
+AsyncOpenAI client, checking that repeated failures escalate to the fallback model.
+"""
+
+import json
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+from property_recommender.match_reasoning.features import matcher as matcher_module
+from property_recommender.match_reasoning.features.matcher import Matcher
+
+SCHEMA_PATH = (
+    Path(__file__).parents[1]
+    / "property_recommender" / "match_reasoning" / "schemas" / "property_match.json"
+)
+
+PROFILE = {"structured_needs": {}}
+PROPERTY = {"ListingId": 1, "Title": "3 bedroom house"}
+
+BAD_ENTRY = {"property_id": 1, "score": 5, "rationale": "Out of range score."}
+GOOD_ENTRY = {"property_id": 1, "score": 0.8, "rationale": "Meets most needs."}
+
+
+class _FakeStream:
+    """Async iterator over one streamed chunk carrying all of `content`."""
+
+    def __init__(self, content: str):
+        self._chunks = [SimpleNamespace(choices=[SimpleNamespace(
+            delta=SimpleNamespace(content=content),
+            finish_reason="stop",
+        )])]
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for chunk in self._chunks:
+            yield chunk
+
+    async def close(self):
+        pass
+
+
+class _FakeAsyncClient:
+    """Answers chat.completions.create with the payload for each model in turn."""
+
+    def __init__(self, payload_for_model):
+        self.payload_for_model = payload_for_model
+        self.models = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, model, stream=False, **kwargs):
+        self.models.append(model)
+        payload = self.payload_for_model(model)
+        content = None if payload is None else json.dumps(payload)
+        if stream:
+            return _FakeStream(content)
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")])
+
+
+def _make_matcher(monkeypatch, fake):
+    monkeypatch.setattr(matcher_module, "get_client", lambda api_key=None: None)
+    monkeypatch.setattr(matcher_module, "get_async_client", lambda api_key=None: fake)
+    return Matcher(
+        schema_path=SCHEMA_PATH,
+        model="gpt-4o-mini",
+        retry_limit=2,
+        api_key="test-key",
+        fallback_model="gpt-4o",
+    )
+
+
+def test_escalate():
+    m = Matcher.__new__(Matcher)
+    m.fallback_model = "gpt-4o"
+    assert m._escalate("gpt-4o-mini", 1) is None
+    assert m._escalate("gpt-4o-mini", 2) == "gpt-4o"
+    assert m._escalate("gpt-4o", 3) is None
+    m.fallback_model = None
+    assert m._escalate("gpt-4o-mini", 2) is None
+
+
+def test_individual_escalates_after_validation_failures(monkeypatch):
+    fake = _FakeAsyncClient(lambda model: GOOD_ENTRY if model == "gpt-4o" else BAD_ENTRY)
+    matcher = _make_matcher(monkeypatch, fake)
+
+    matches = asyncio.run(matcher.amatch_individual(PROFILE, [PROPERTY]))
+
+    assert fake.models == ["gpt-4o-mini", "gpt-4o-mini", "gpt-4o"]
+    assert matches == [GOOD_ENTRY]
+
+
+def test_individual_escalates_after_refusals(monkeypatch):
+    fake = _FakeAsyncClient(lambda model: GOOD_ENTRY if model == "gpt-4o" else None)
+    matcher = _make_matcher(monkeypatch, fake)
+
+    matches = asyncio.run(matcher.amatch_individual(PROFILE, [PROPERTY]))
+
+    assert fake.models == ["gpt-4o-mini", "gpt-4o-mini", "gpt-4o"]
+    assert matches == [GOOD_ENTRY]
+
+
+def test_batch_escalates_after_validation_failures(monkeypatch):
+    fake = _FakeAsyncClient(
+        lambda model: {"matches": [GOOD_ENTRY if model == "gpt-4o" else BAD_ENTRY]}
+    )
+    matcher = _make_matcher(monkeypatch, fake)
+
+    matches = asyncio.run(matcher.amatch_batch(PROFILE, [PROPERTY]))
+
+    assert fake.models == ["gpt-4o-mini", "gpt-4o-mini", "gpt-4o"]
+    assert matches == [GOOD_ENTRY]